@@ -156,7 +156,7 @@ std::shared_ptr<OpenSANDConf::MetaModel> OpenSANDConf::fromXSD(const std::string
 	std::vector<xmlNodePtr> enumsnodes;
 
 	// Read document
-	doc = xmlReadFile(filepath.c_str(), CONFIGURATION_FILES_ENCODING, 0);
+	doc = xmlReadFile(filepath.c_str(), CONFIGURATION_FILES_ENCODING, XML_PARSE_NOBLANKS);
 	if(doc == nullptr)
 	{
 		return nullptr;
@@ -300,7 +300,7 @@ std::shared_ptr<OpenSANDConf::DataModel> OpenSANDConf::fromXML(std::shared_ptr<O
 	}
 
 	// Read and check document
-	doc = xmlReadFile(filepath.c_str(), CONFIGURATION_FILES_ENCODING, 0);
+	doc = xmlReadFile(filepath.c_str(), CONFIGURATION_FILES_ENCODING, XML_PARSE_NOBLANKS);
 	if(doc == nullptr)
 	{
 		xmlSchemaFree(schema);
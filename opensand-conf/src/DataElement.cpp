@@ -156,10 +156,9 @@ const std::string &OpenSANDConf::DataElement::getParentPath() const
 
 std::string OpenSANDConf::DataElement::getPath() const
 {
-	std::stringstream ss;
-	ss << this->parent << "/" << this->getId();
+	std::string path = this->parent + "/" + this->getId();
 	// check root case
-	return ss.str() != "/" ? ss.str() : "";
+	return path != "/" ? path : "";
 }
 
 void OpenSANDConf::DataElement::setReference(std::shared_ptr<const OpenSANDConf::DataParameter> target)
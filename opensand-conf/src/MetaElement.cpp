@@ -108,10 +108,9 @@ const std::string &OpenSANDConf::MetaElement::getParentPath() const
 
 std::string OpenSANDConf::MetaElement::getPath() const
 {
-	std::stringstream ss;
-	ss << this->parent << "/" << this->getId();
+	std::string path = this->parent + "/" + this->getId();
 	// check root case
-	return ss.str() != "/" ? ss.str() : "";
+	return path != "/" ? path : "";
 }
 
 bool OpenSANDConf::MetaElement::isAdvanced() const
@@ -2,11 +2,10 @@ import os
 import shlex
 import shutil
 import tarfile
-import tempfile
 import traceback
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from types import SimpleNamespace
 
 from fabric import Connection
 from paramiko.client import MissingHostKeyPolicy
@@ -108,6 +107,25 @@ QOS_CLASSES = [
 ]
 
 
+GATEWAY_PARAMETERS = (
+        'ctrl_multicast_address',
+        'data_multicast_address',
+        'ctrl_out_st_port',
+        'ctrl_in_st_port',
+        'ctrl_out_gw_port',
+        'ctrl_in_gw_port',
+        'logon_out_port',
+        'logon_in_port',
+        'data_out_st_port',
+        'data_in_st_port',
+        'data_out_gw_port',
+        'data_in_gw_port',
+        'udp_stack',
+        'udp_rmem',
+        'udp_wmem',
+)
+
+
 def success(message='OK', **kwargs):
     result = {'status': message, **kwargs}
     return jsonify(result)
@@ -166,11 +184,20 @@ def normalize_xsd_folder(folder_name):
     return folder.name
 
 
+@lru_cache(maxsize=16)
+def _read_xsd_file(filepath, mtime):
+    return py_opensand_conf.fromXSD(filepath)
+
+
 def read_xml_file(filepath, xsd_name):
     if not xsd_name.endswith('.xsd'):
         xsd_name += '.xsd'
 
-    xsd = py_opensand_conf.fromXSD(MODELS_FOLDER.joinpath(xsd_name).as_posix())
+    xsd_path = MODELS_FOLDER.joinpath(xsd_name)
+    if not xsd_path.is_file():
+        return None
+
+    xsd = _read_xsd_file(xsd_path.as_posix(), xsd_path.stat().st_mtime)
     if xsd is not None:
         return py_opensand_conf.fromXML(xsd, filepath.as_posix())
 
@@ -495,6 +522,7 @@ def create_platform_infrastructure(project):
             'gateways': {},
             'terminals': {},
     }
+    infrastructure_files = []
     for entity_id, _ in enumerate(entities.get_items()):
         # Can't directly use the items iterated over because of bad cast;
         # so retrieve them one by one instead to get the proper type.
@@ -508,6 +536,7 @@ def create_platform_infrastructure(project):
         xml = read_xml_file(filepath, infra)
         if xml is None:
             continue
+        infrastructure_files.append((filepath, xml))
 
         entity = xml.get_root().get_component('entity')
         entity_type = _get_parameter(entity, 'entity_type')
@@ -525,21 +554,8 @@ def create_platform_infrastructure(project):
                 gateway = {'entity_id': entity_id}
                 gateway['emu_address'] = _get_parameter(entity_gw, 'emu_address')
                 gateway['mac_address'] = _get_parameter(entity_gw, 'mac_address')
-                gateway['ctrl_multicast_address'] = _get_parameter(entity_gw, 'ctrl_multicast_address')
-                gateway['data_multicast_address'] = _get_parameter(entity_gw, 'data_multicast_address')
-                gateway['ctrl_out_st_port'] = _get_parameter(entity_gw, 'ctrl_out_st_port')
-                gateway['ctrl_in_st_port'] = _get_parameter(entity_gw, 'ctrl_in_st_port')
-                gateway['ctrl_out_gw_port'] = _get_parameter(entity_gw, 'ctrl_out_gw_port')
-                gateway['ctrl_in_gw_port'] = _get_parameter(entity_gw, 'ctrl_in_gw_port')
-                gateway['logon_out_port'] = _get_parameter(entity_gw, 'logon_out_port')
-                gateway['logon_in_port'] = _get_parameter(entity_gw, 'logon_in_port')
-                gateway['data_out_st_port'] = _get_parameter(entity_gw, 'data_out_st_port')
-                gateway['data_in_st_port'] = _get_parameter(entity_gw, 'data_in_st_port')
-                gateway['data_out_gw_port'] = _get_parameter(entity_gw, 'data_out_gw_port')
-                gateway['data_in_gw_port'] = _get_parameter(entity_gw, 'data_in_gw_port')
-                gateway['udp_stack'] = _get_parameter(entity_gw, 'udp_stack')
-                gateway['udp_rmem'] = _get_parameter(entity_gw, 'udp_rmem')
-                gateway['udp_wmem'] = _get_parameter(entity_gw, 'udp_wmem')
+                for parameter in GATEWAY_PARAMETERS:
+                    gateway[parameter] = _get_parameter(entity_gw, parameter)
                 infrastructure['gateways'][entity_id] = gateway
         elif entity_type == "Gateway Net Access":
             entity_gw_net_acc = entity.get_component('entity_gw_net_acc')
@@ -554,21 +570,8 @@ def create_platform_infrastructure(project):
             if entity_id is not None:
                 gateway = infrastructure['gateways'].get(entity_id, {'entity_id': entity_id})
                 gateway['emu_address'] = _get_parameter(entity_gw_phy, 'emu_address')
-                gateway['ctrl_multicast_address'] = _get_parameter(entity_gw_phy, 'ctrl_multicast_address')
-                gateway['data_multicast_address'] = _get_parameter(entity_gw_phy, 'data_multicast_address')
-                gateway['ctrl_out_st_port'] = _get_parameter(entity_gw_phy, 'ctrl_out_st_port')
-                gateway['ctrl_in_st_port'] = _get_parameter(entity_gw_phy, 'ctrl_in_st_port')
-                gateway['ctrl_out_gw_port'] = _get_parameter(entity_gw_phy, 'ctrl_out_gw_port')
-                gateway['ctrl_in_gw_port'] = _get_parameter(entity_gw_phy, 'ctrl_in_gw_port')
-                gateway['logon_out_port'] = _get_parameter(entity_gw_phy, 'logon_out_port')
-                gateway['logon_in_port'] = _get_parameter(entity_gw_phy, 'logon_in_port')
-                gateway['data_out_st_port'] = _get_parameter(entity_gw_phy, 'data_out_st_port')
-                gateway['data_in_st_port'] = _get_parameter(entity_gw_phy, 'data_in_st_port')
-                gateway['data_out_gw_port'] = _get_parameter(entity_gw_phy, 'data_out_gw_port')
-                gateway['data_in_gw_port'] = _get_parameter(entity_gw_phy, 'data_in_gw_port')
-                gateway['udp_stack'] = _get_parameter(entity_gw_phy, 'udp_stack')
-                gateway['udp_rmem'] = _get_parameter(entity_gw_phy, 'udp_rmem')
-                gateway['udp_wmem'] = _get_parameter(entity_gw_phy, 'udp_wmem')
+                for parameter in GATEWAY_PARAMETERS:
+                    gateway[parameter] = _get_parameter(entity_gw_phy, parameter)
                 infrastructure['gateways'][entity_id] = gateway
         elif entity_type == "Terminal":
             entity_st = entity.get_component('entity_st')
@@ -579,20 +582,7 @@ def create_platform_infrastructure(project):
                 terminal['mac_address'] = _get_parameter(entity_st, 'mac_address')
                 infrastructure['terminals'][entity_id] = terminal
 
-    for entity_id, _ in enumerate(entities.get_items()):
-        # Can't directly use the items iterated over because of bad cast;
-        # so retrieve them one by one instead to get the proper type.
-        entity = entities.get_item(str(entity_id))
-        name = _get_parameter(entity, 'entity_name')
-        infra = _get_parameter(entity, 'infrastructure')
-        if not name or not infra:
-            continue
-
-        filepath = WWW_FOLDER / project / 'entities' / name / 'infrastructure.xml'
-        xml = read_xml_file(filepath, infra)
-        if xml is None:
-            continue
-
+    for filepath, xml in infrastructure_files:
         infra = xml.get_root().get_component('infrastructure')
         if infra is None:
             continue
@@ -617,21 +607,8 @@ def create_platform_infrastructure(project):
             _set_parameter(gw, 'entity_id', gateway.get('entity_id'))
             _set_parameter(gw, 'emu_address', gateway.get('emu_address'))
             _set_parameter(gw, 'mac_address', gateway.get('mac_address'))
-            _set_parameter(gw, 'ctrl_multicast_address', gateway.get('ctrl_multicast_address'))
-            _set_parameter(gw, 'data_multicast_address', gateway.get('data_multicast_address'))
-            _set_parameter(gw, 'ctrl_out_st_port', gateway.get('ctrl_out_st_port'))
-            _set_parameter(gw, 'ctrl_in_st_port', gateway.get('ctrl_in_st_port'))
-            _set_parameter(gw, 'ctrl_out_gw_port', gateway.get('ctrl_out_gw_port'))
-            _set_parameter(gw, 'ctrl_in_gw_port', gateway.get('ctrl_in_gw_port'))
-            _set_parameter(gw, 'logon_out_port', gateway.get('logon_out_port'))
-            _set_parameter(gw, 'logon_in_port', gateway.get('logon_in_port'))
-            _set_parameter(gw, 'data_out_st_port', gateway.get('data_out_st_port'))
-            _set_parameter(gw, 'data_in_st_port', gateway.get('data_in_st_port'))
-            _set_parameter(gw, 'data_out_gw_port', gateway.get('data_out_gw_port'))
-            _set_parameter(gw, 'data_in_gw_port', gateway.get('data_in_gw_port'))
-            _set_parameter(gw, 'udp_stack', gateway.get('udp_stack'))
-            _set_parameter(gw, 'udp_rmem', gateway.get('udp_rmem'))
-            _set_parameter(gw, 'udp_wmem', gateway.get('udp_wmem'))
+            for parameter in GATEWAY_PARAMETERS:
+                _set_parameter(gw, parameter, gateway.get(parameter))
 
         terminals = infra.get_list('terminals')
         if terminals is not None:
@@ -827,7 +804,7 @@ def upload_entity(name, entity):
 
         for file in files:
             with file.open('rb') as source, destination.joinpath(file.name).open('wb') as dest:
-                dest.write(source.read())
+                shutil.copyfileobj(source, dest)
             destination.joinpath(file.name).chmod(0o0666)
 
     passwords = {
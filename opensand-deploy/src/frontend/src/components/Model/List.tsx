@@ -26,7 +26,7 @@ import {noActions} from '../../utils/actions';
 import type {IActions} from '../../utils/actions';
 import {useListMutators} from '../../utils/hooks';
 import {getParameters} from '../../xsd';
-import type {Component as ComponentType, List as ListType} from '../../xsd';
+import type {Component as ComponentType, List as ListType, Parameter as ParameterType} from '../../xsd';
 
 
 const BorderlessTableRow = styled(TableRow, {name: "BorderlessTableRow", slot: "Wrapper"})({
@@ -47,7 +47,9 @@ const Row: React.FC<RowProps> = (props) => {
 
     const [open, setOpen] = React.useState<boolean>(false);
 
-    const parameters = getParameters(component, form.values);
+    const parameters = new Map(getParameters(component, form.values).map((p: ParameterType): [string, ParameterType] => (
+        [p.id, p]
+    )));
 
     return (
         <React.Fragment>
@@ -63,7 +65,7 @@ const Row: React.FC<RowProps> = (props) => {
                     </TableCell>
                 )}
                 {headers.map((id: string, i: number) => {
-                    const param = parameters.find(p => p.id === id);
+                    const param = parameters.get(id);
                     const value = param?.value;
                     return (
                         <TableCell key={i+2} align="center">
@@ -174,8 +174,11 @@ const EnumParam: React.FC<EnumProps> = (props) => {
             <IconButton><HelpIcon /></IconButton>
         </Tooltip>
     );
-    const choices = enumeration.map((v: string, i: number) => <MenuItem value={v} key={i+1}>{v}</MenuItem>);
-    choices.splice(0, 0, <MenuItem value="" key={0}>{header}</MenuItem>);
+    const choices = React.useMemo(() => {
+        const items = enumeration.map((v: string, i: number) => <MenuItem value={v} key={i+1}>{v}</MenuItem>);
+        items.splice(0, 0, <MenuItem value="" key={0}>{header}</MenuItem>);
+        return items;
+    }, [enumeration, header]);
 
     return (
         <FlexBox>
@@ -289,8 +292,11 @@ const XsdParameter: React.FC<XsdProps> = (props) => {
         }
     }, [header]);
 
-    const choices = templatesNames.map((v: string, i: number) => <MenuItem value={v} key={i+1}>{v}</MenuItem>);
-    choices.splice(0, 0, <MenuItem value="" key={0}>{header}</MenuItem>);
+    const choices = React.useMemo(() => {
+        const items = templatesNames.map((v: string, i: number) => <MenuItem value={v} key={i+1}>{v}</MenuItem>);
+        items.splice(0, 0, <MenuItem value="" key={0}>{header}</MenuItem>);
+        return items;
+    }, [templatesNames, header]);
 
     return (
         <FlexBox>
@@ -340,6 +346,7 @@ const Parameter: React.FC<Props> = (props) => {
     const {parameter, readOnly, entity, actions, prefix, ...rest} = props;
 
     const model = useSelector((state) => state.model.model);
+    const enumeration = React.useMemo(() => model?.environment?.enums?.find(e => e.id === parameter.type), [model, parameter.type]);
 
     const isReadOnly = readOnly || parameter.readOnly;
     const name = prefix + ".value";
@@ -357,7 +364,6 @@ const Parameter: React.FC<Props> = (props) => {
         );
     }
 
-    const enumeration = model?.environment?.enums?.find(e => e.id === parameter.type);
     if (enumeration != null) {
         return (
             <EnumParam
@@ -141,14 +141,14 @@ export const isVisible = (element: NamedElement, visibility: Visibility, root: C
         return true;
     }
 
-    const drawable = refPath === "" ? true : getPathValueComponent(root, refPath.split("/").slice(1)) === refValue;
+    const drawable = refPath === "" ? true : getPathValueComponent(root, refPath.split("/"), 1) === refValue;
     const visible = drawable && (!advanced || visibility !== "NORMAL");
 
     if (visible && isContainer(element)) {
         if (isList(element)) {
             return isVisible(element.pattern, visibility, root);
         } else {
-            return element.elements.filter((e: Element) => isVisible(e.element, visibility, root)).length > 0;
+            return element.elements.some((e: Element) => isVisible(e.element, visibility, root));
         }
     }
 
@@ -161,36 +161,36 @@ export const isComplete = (model: Model, visibility: Visibility) => {
 };
 
 
-const getPathValueComponent = (component: Component, path: string[]): string => {
-    const [id, ...subPath] = path;
+const getPathValueComponent = (component: Component, path: string[], depth: number): string => {
+    const id = path[depth];
 
     const element = component.elements.find((e: Element) => e.element.id === id);
     if (isComponentElement(element)) {
-        return getPathValueComponent(element.element, subPath);
+        return getPathValueComponent(element.element, path, depth + 1);
     } else if (isListElement(element)) {
-        return getPathValueList(element.element, subPath);
+        return getPathValueList(element.element, path, depth + 1);
     } else if (isParameterElement(element)) {
-        return getPathValueParameter(element.element, subPath);
+        return getPathValueParameter(element.element, path, depth + 1);
     }
 
     return "";
 };
 
 
-const getPathValueList = (list: List, path: string[]): string => {
-    const [index, ...subPath] = path;
+const getPathValueList = (list: List, path: string[], depth: number): string => {
+    const index = path[depth];
 
     const element = list.elements[Number(index)];
     if (element) {
-        return getPathValueComponent(element, subPath);
+        return getPathValueComponent(element, path, depth + 1);
     }
 
     return "";
 };
 
 
-const getPathValueParameter = (parameter: Parameter, path: string[]): string => {
-    if (path.length) {
+const getPathValueParameter = (parameter: Parameter, path: string[], depth: number): string => {
+    if (depth < path.length) {
         return "";
     }
     return parameter.value;
@@ -172,7 +172,7 @@ void FileLogHandler::emitLog(const std::string& logName, const std::string& leve
 }
 
 
-SocketStatHandler::SocketStatHandler(const std::string& entityName, const std::string& address, unsigned short port, bool useTCP) : StatHandler(entityName), useTcp(useTCP) {
+SocketStatHandler::SocketStatHandler(const std::string& entityName, const std::string& address, unsigned short port, bool useTCP) : StatHandler(entityName), useTcp(useTCP), entityTrailer(" entity " + entityName) {
 	remote.sin_family = AF_INET;
 	remote.sin_port = htons(port);
 	if (inet_pton(AF_INET, address.c_str(), &remote.sin_addr) < 0) {
@@ -217,7 +217,7 @@ void SocketStatHandler::emitStats(const std::vector<std::pair<std::string, std::
 		return;
 	}
 
-	formatter << " entity " << entityName;
+	formatter << entityTrailer;
 	std::string msg = formatter.str();
 
 	if (useTcp) {
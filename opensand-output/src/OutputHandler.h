@@ -99,6 +99,7 @@ class SocketStatHandler : public StatHandler {
 	int socketFd;
 	struct sockaddr_in remote;
 	bool useTcp;
+	std::string entityTrailer;
 
 	std::vector<std::string> statNames;
 };